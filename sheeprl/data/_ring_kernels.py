@@ -0,0 +1,38 @@
+"""Compiled kernels for the ring-buffer index math of the replay buffers.
+
+When numba is installed the kernels are JIT-compiled to tight native loops that
+fill the index arrays in a single pass; otherwise they fall back to equivalent
+vectorized numpy implementations. Both variants share the same signatures, so
+the buffers can call them unconditionally.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from sheeprl.utils.imports import _IS_NUMBA_AVAILABLE
+
+if _IS_NUMBA_AVAILABLE:
+    from numba import njit
+
+    @njit(cache=True)
+    def valid_indices(pos: int, buffer_size: int, first_range_end: int) -> np.ndarray:
+        second_range_end = buffer_size if first_range_end >= 0 else buffer_size + first_range_end
+        n = max(first_range_end, 0) + max(second_range_end - pos, 0)
+        out = np.empty(n, dtype=np.intp)
+        j = 0
+        for i in range(first_range_end):
+            out[j] = i
+            j += 1
+        for i in range(pos, second_range_end):
+            out[j] = i
+            j += 1
+        return out
+
+else:
+
+    def valid_indices(pos: int, buffer_size: int, first_range_end: int) -> np.ndarray:
+        second_range_end = buffer_size if first_range_end >= 0 else buffer_size + first_range_end
+        return np.concatenate(
+            (np.arange(0, first_range_end, dtype=np.intp), np.arange(pos, second_range_end, dtype=np.intp))
+        )
@@ -13,12 +13,38 @@ import numpy as np
 import torch
 from torch import Tensor
 
+from sheeprl.data._ring_kernels import valid_indices as _valid_indices
 from sheeprl.utils.memmap import MemmapArray
 from sheeprl.utils.utils import NUMPY_TO_TORCH_DTYPE_DICT
 
 
+class _ArrayPool:
+    """A pool of scratch numpy arrays, keyed by name, that the buffers gather
+    sampled batches into. Since the batch shape is essentially constant across a
+    training run, the pool hits on nearly every request and steady-state sampling
+    performs no allocations; an array is reallocated only when the requested shape
+    or dtype changes."""
+
+    def __init__(self) -> None:
+        self._arrays: Dict[str, np.ndarray] = {}
+
+    def get(self, key: str, shape: Sequence[int], dtype: np.dtype) -> np.ndarray:
+        """Return the pooled array for 'key', reallocating it only when the
+        requested shape or dtype changes."""
+        out = self._arrays.get(key)
+        if out is None or out.shape != tuple(shape) or out.dtype != dtype:
+            out = np.empty(shape, dtype=dtype)
+            self._arrays[key] = out
+        return out
+
+    def clear(self) -> None:
+        self._arrays.clear()
+
+
 class ReplayBuffer:
     batch_axis: int = 1
+    # Number of random bits pre-generated by '_rand_idxes' in a single generator call
+    rng_pool_size: int = 2**18
 
     def __init__(
         self,
@@ -28,12 +54,22 @@ class ReplayBuffer:
         memmap: bool = False,
         memmap_dir: str | os.PathLike | None = None,
         memmap_mode: str = "r+",
+        dtype_overrides: Dict[str, np.dtype] | None = None,
+        reuse_sample_storage: bool = False,
         **kwargs,
     ):
         """A standard replay buffer implementation. Internally this is represented by a
         dictionary mapping string to numpy arrays. The first dimension of the arrays is the
         buffer size, while the second dimension is the number of environments.
 
+        The [buffer_size, n_envs, ...] layout is part of the public contract: 'buffer',
+        '__getitem__' and '__setitem__' expose the storage directly and checkpoints
+        serialize it as-is, so it interleaves the timelines of the environments with a
+        stride of 'n_envs'. When per-environment locality of the sampling gather matters
+        (e.g. disk-backed memmap buffers sampled in long sequences), use
+        'EnvIndependentReplayBuffer', which stores each environment's timeline as its own
+        contiguous single-env buffer.
+
         Args:
             buffer_size (int): the buffer size.
             n_envs (int, optional): the number of environments. Defaults to 1.
@@ -45,6 +81,18 @@ class ReplayBuffer:
             memmap_mode (str, optional): memory-map mode.
                 Possible values are: "r+", "w+", "c", "copyonwrite", "readwrite", "write".
                 Defaults to "r+".
+            dtype_overrides (Dict[str, np.dtype] | None, optional): storage dtype per key,
+                overriding the dtype of the added data (e.g. store float64 rewards as
+                float16). Values are cast on write and sampled back in the storage dtype;
+                use the 'dtype' argument of 'sample_tensors' to convert the batches back.
+                Narrower dtypes halve the bytes moved by the sampling gather and double
+                the effective buffer capacity. Defaults to None.
+            reuse_sample_storage (bool, optional): whether to gather sampled batches into
+                per-buffer scratch storage that is recycled across 'sample' calls, so that
+                steady-state sampling performs no output allocations. When enabled, batches
+                sampled with 'clone=False' are only valid until the next 'sample' call;
+                callers that hold on to a batch across samples must pass 'clone=True'.
+                Defaults to False, in which case every batch owns its storage.
             kwargs: additional keyword arguments.
         """
         if buffer_size <= 0:
@@ -57,6 +105,8 @@ class ReplayBuffer:
         self._memmap = memmap
         self._memmap_dir = memmap_dir
         self._memmap_mode = memmap_mode
+        self._dtype_overrides = dict(dtype_overrides) if dtype_overrides is not None else {}
+        self._reuse_sample_storage = reuse_sample_storage
         self._buf: Dict[str, np.ndarray | MemmapArray] = {}
         if self._memmap:
             if self._memmap_mode not in ("r+", "w+", "c", "copyonwrite", "readwrite", "write"):
@@ -77,6 +127,19 @@ class ReplayBuffer:
         self._full = False
         self._memmap_specs = {}
         self._rng: np.random.Generator = np.random.default_rng()
+        self._rng_pool: np.ndarray | None = None
+        self._rng_cursor = 0
+        # Cache of the valid sampling indices: between two 'add' calls the buffer
+        # state does not change, so the indices can be reused across 'sample' calls
+        self._valid_idxes_cache: np.ndarray | None = None
+        self._valid_idxes_key: tuple | None = None
+        # Scratch storage the sampled batches are gathered into, recycled
+        # across 'sample' calls as long as the requested batch shape is unchanged
+        self._out_pool = _ArrayPool()
+        # When the buffer size is a power of two the wrap-around modulo can be
+        # replaced by a cheaper bitwise AND with 'buffer_size - 1'
+        self._is_pow2 = buffer_size & (buffer_size - 1) == 0
+        self._mask = buffer_size - 1
 
     @property
     def buffer(self) -> Dict[str, np.ndarray]:
@@ -105,6 +168,91 @@ class ReplayBuffer:
     def __len__(self) -> int:
         return self.buffer_size
 
+    def __getstate__(self) -> Dict[str, typing.Any]:
+        """Drop the transient sampling caches from the pickled state: the pre-filled RNG
+        pool, the valid-index cache and the output pool are pure caches that rebuild on
+        first use, and would otherwise bloat every checkpoint (and resurrect a stale RNG
+        pool next to the restored generator state)."""
+        state = self.__dict__.copy()
+        state["_rng_pool"] = None
+        state["_rng_cursor"] = 0
+        state["_valid_idxes_cache"] = None
+        state["_valid_idxes_key"] = None
+        state["_out_pool"] = _ArrayPool()
+        return state
+
+    def __setstate__(self, state: Dict[str, typing.Any]) -> None:
+        """Restore a pickled buffer, defaulting the attributes that did not exist when
+        the checkpoint was written. The algorithms pickle the buffer object whole into
+        the checkpoint and restore it without running '__init__', so checkpoints written
+        by older versions of this class must still unpickle into a working buffer."""
+        self.__dict__.update(state)
+        self.__dict__.setdefault("_dtype_overrides", {})
+        self.__dict__.setdefault("_reuse_sample_storage", False)
+        self.__dict__.setdefault("_rng_pool", None)
+        self.__dict__.setdefault("_rng_cursor", 0)
+        self.__dict__.setdefault("_valid_idxes_cache", None)
+        self.__dict__.setdefault("_valid_idxes_key", None)
+        self.__dict__.setdefault("_out_pool", _ArrayPool())
+        if "_is_pow2" not in self.__dict__:
+            self._is_pow2 = self._buffer_size & (self._buffer_size - 1) == 0
+            self._mask = self._buffer_size - 1
+
+    def _maybe_init(self, data: Dict[str, np.ndarray]) -> None:
+        """Lazily allocate the backing storage on the first 'add'. The schema is
+        inferred from the first added sample: one contiguous array (or memory-mapped
+        file) per key, shaped [buffer_size, n_envs, ...] after the first two batch
+        dimensions of the incoming data. Subsequent calls are no-ops."""
+        if not self.empty:
+            return
+        for k, v in data.items():
+            dtype = self._dtype_overrides.get(k, v.dtype)
+            if self._memmap:
+                self.buffer[k] = MemmapArray(
+                    filename=Path(self._memmap_dir / f"{k}.memmap"),
+                    dtype=dtype,
+                    shape=(self._buffer_size, self._n_envs, *v.shape[2:]),
+                    mode=self._memmap_mode,
+                )
+            else:
+                self.buffer[k] = np.empty(shape=(self._buffer_size, self._n_envs, *v.shape[2:]), dtype=dtype)
+
+    def _wrap(self, idxes: int | np.ndarray) -> int | np.ndarray:
+        """Wrap positions or index arrays into [0, buffer_size), using a bitmask
+        when the buffer size is a power of two and the modulo otherwise."""
+        if self._is_pow2:
+            return idxes & self._mask
+        return idxes % self._buffer_size
+
+    def _increment(self, idxes: np.ndarray) -> np.ndarray:
+        """Advance ring indices by one step. The input indices are already in
+        [0, buffer_size), so rather than a full modulo only the entries that reach
+        'buffer_size' need to wrap back to zero (a bitmask when the buffer size is
+        a power of two)."""
+        nxt = idxes + 1
+        if self._is_pow2:
+            return nxt & self._mask
+        nxt[nxt == self._buffer_size] = 0
+        return nxt
+
+    def _rand_idxes(self, n: int, high: int) -> np.ndarray:
+        """Draw 'n' uniformly distributed indices in [0, 'high'). The random bits
+        are sliced from a pool that is pre-filled with a single generator call and
+        refilled only when exhausted, amortizing the per-call generator overhead
+        across many 'sample' calls. Oversized requests (or a zero-sized pool,
+        which disables the pooling) fall back to the generator directly."""
+        if high <= 0 or n > self.rng_pool_size:
+            # delegate to the generator, which also raises on an empty range
+            return self._rng.integers(0, high, size=(n,), dtype=np.intp)
+        if self._rng_pool is None or self._rng_cursor + n > len(self._rng_pool):
+            self._rng_pool = self._rng.integers(0, np.iinfo(np.int64).max, size=(self.rng_pool_size,), dtype=np.int64)
+            self._rng_cursor = 0
+        bits = self._rng_pool[self._rng_cursor : self._rng_cursor + n]
+        self._rng_cursor += n
+        if high & (high - 1) == 0:
+            return (bits & (high - 1)).astype(np.intp, copy=False)
+        return (bits % high).astype(np.intp, copy=False)
+
     @torch.no_grad()
     def to_tensor(
         self,
@@ -112,6 +260,7 @@ class ReplayBuffer:
         clone: bool = False,
         device: str | torch.dtype = "cpu",
         from_numpy: bool = False,
+        pin_memory: bool = False,
     ) -> Dict[str, Tensor]:
         """Converts the replay buffer to a dictionary mapping string to torch.Tensor.
 
@@ -125,13 +274,18 @@ class ReplayBuffer:
                 Defaults to "cpu".
             from_numpy (bool, optional): whether to convert the numpy arrays to torch tensors
                 with the 'torch.from_numpy' function. Defaults to False.
+            pin_memory (bool, optional): whether to stage host-to-device copies through
+                page-locked memory, enabling asynchronous transfers. Only relevant when
+                moving the tensors to a CUDA device. Defaults to False.
 
         Returns:
             Dict[str, Tensor]: the converted buffer.
         """
         buf = {}
         for k, v in self.buffer.items():
-            buf[k] = get_tensor(v, dtype=dtype, clone=clone, device=device, from_numpy=from_numpy)
+            buf[k] = get_tensor(
+                v, dtype=dtype, clone=clone, device=device, from_numpy=from_numpy, pin_memory=pin_memory
+            )
         return buf
 
     @typing.overload
@@ -191,34 +345,54 @@ class ReplayBuffer:
                     last_key = current_key
                     last_batch_shape = current_batch_shape
         data_len = next(iter(data.values())).shape[0]
-        next_pos = (self._pos + data_len) % self._buffer_size
-        if next_pos <= self._pos or (data_len > self._buffer_size and not self._full):
-            idxes = np.array(list(range(self._pos, self._buffer_size)) + list(range(0, next_pos)))
-        else:
-            idxes = np.array(range(self._pos, next_pos))
+        next_pos = self._wrap(self._pos + data_len)
         if data_len > self._buffer_size:
-            data_to_store = {k: v[-self._buffer_size - next_pos :] for k, v in data.items()}
-        else:
-            data_to_store = data
-        if self._memmap and self.empty:
+            # Keep only the tail that fits: exactly the last 'buffer_size' steps,
+            # laid out on the ring so that the newest element lands at 'next_pos - 1'
+            data_to_store = {k: v[data_len - self._buffer_size :] for k, v in data.items()}
+            self._maybe_init(data_to_store)
+            head = self._buffer_size - next_pos
             for k, v in data_to_store.items():
-                self.buffer[k] = MemmapArray(
-                    filename=Path(self._memmap_dir / f"{k}.memmap"),
-                    dtype=v.dtype,
-                    shape=(self._buffer_size, self._n_envs, *v.shape[2:]),
-                    mode=self._memmap_mode,
-                )
-                self.buffer[k][idxes] = data_to_store[k]
-        elif self.empty:
-            for k, v in data_to_store.items():
-                self.buffer[k] = np.empty(shape=(self._buffer_size, self._n_envs, *v.shape[2:]), dtype=v.dtype)
-                self.buffer[k][idxes] = data_to_store[k]
+                self.buffer[k][next_pos:] = v[:head]
+                self.buffer[k][:next_pos] = v[head:]
         else:
-            for k, v in data_to_store.items():
-                self.buffer[k][idxes] = data_to_store[k]
+            self._maybe_init(data)
+            if next_pos > self._pos:
+                # Fast path: the incoming data fits before the end of the buffer,
+                # so every key can be written with a plain slice copy
+                for k, v in data.items():
+                    self.buffer[k][self._pos : next_pos] = v
+            else:
+                # Wrap-around: split the write into two contiguous slice copies
+                tail = self._buffer_size - self._pos
+                for k, v in data.items():
+                    self.buffer[k][self._pos :] = v[:tail]
+                    self.buffer[k][:next_pos] = v[tail:]
         if self._pos + data_len >= self._buffer_size:
             self._full = True
         self._pos = next_pos
+        self._valid_idxes_key = None
+
+    def add_many(self, chunks: Sequence["ReplayBuffer" | Dict[str, np.ndarray]], validate_args: bool = False) -> None:
+        """Add a sequence of chunks to the replay buffer with a single write. The chunks
+        are concatenated along the time dimension, so the wrap arithmetic and the
+        per-key slice copies of 'add' are paid once for the whole batch instead of once
+        per chunk. Callers that collect trajectories step by step can accumulate 'k'
+        steps and call 'add_many' every 'k' steps.
+
+        Args:
+            chunks (Sequence[ReplayBuffer | Dict[str, np.ndarray]]): the chunks to add. Every
+                chunk must contain the same keys, with values of shape [sequence_length, n_envs, ...].
+            validate_args (bool, optional): whether to validate the arguments. Defaults to False.
+        """
+        if len(chunks) == 0:
+            raise ValueError("'chunks' must contain at least one element to add to the replay buffer")
+        if len(chunks) == 1:
+            self.add(chunks[0], validate_args=validate_args)
+            return
+        dicts = [chunk.buffer if isinstance(chunk, ReplayBuffer) else chunk for chunk in chunks]
+        data = {k: np.concatenate([d[k] for d in dicts], axis=0) for k in dicts[0].keys()}
+        self.add(data, validate_args=validate_args)
 
     def sample(
         self, batch_size: int, sample_next_obs: bool = False, clone: bool = False, n_samples: int = 1, **kwargs
@@ -233,7 +407,10 @@ class ReplayBuffer:
             batch_size (int): Number of element to sample
             sample_next_obs (bool): whether to sample the next observations from the 'self.obs_keys' keys.
                 Defaults to False.
-            clone (bool): whether to clone the sampled numpy arrays. Defaults to False.
+            clone (bool): whether to return batches that own their storage. Only relevant
+                when the buffer was created with 'reuse_sample_storage=True', in which case
+                batches sampled with 'clone=False' are views over per-buffer scratch storage
+                that is overwritten by the next 'sample' call. Defaults to False.
             n_samples (int): the number of samples to perform. Defaults to 1.
 
         Returns:
@@ -246,14 +423,13 @@ class ReplayBuffer:
                 "No sample has been added to the buffer. Please add at least one sample calling 'self.add()'"
             )
         if self._full:
-            first_range_end = self._pos - 1 if sample_next_obs else self._pos
-            second_range_end = self.buffer_size if first_range_end >= 0 else self.buffer_size + first_range_end
-            valid_idxes = np.array(
-                list(range(0, first_range_end)) + list(range(self._pos, second_range_end)), dtype=np.intp
-            )
-            batch_idxes = valid_idxes[
-                self._rng.integers(0, len(valid_idxes), size=(batch_size * n_samples,), dtype=np.intp)
-            ]
+            cache_key = (self._pos, sample_next_obs)
+            if self._valid_idxes_key != cache_key:
+                first_range_end = self._pos - 1 if sample_next_obs else self._pos
+                self._valid_idxes_cache = _valid_indices(self._pos, self.buffer_size, first_range_end)
+                self._valid_idxes_key = cache_key
+            valid_idxes = self._valid_idxes_cache
+            batch_idxes = valid_idxes[self._rand_idxes(batch_size * n_samples, len(valid_idxes))]
         else:
             max_pos_to_sample = self._pos - 1 if sample_next_obs else self._pos
             if max_pos_to_sample == 0:
@@ -261,30 +437,60 @@ class ReplayBuffer:
                     "You want to sample the next observations, but one sample has been added to the buffer. "
                     "Make sure that at least two samples are added."
                 )
-            batch_idxes = self._rng.integers(0, max_pos_to_sample, size=(batch_size * n_samples,), dtype=np.intp)
+            batch_idxes = self._rand_idxes(batch_size * n_samples, max_pos_to_sample)
         return {
             k: v.reshape(n_samples, batch_size, *v.shape[1:])
             for k, v in self._get_samples(batch_idxes=batch_idxes, sample_next_obs=sample_next_obs, clone=clone).items()
         }
 
+    def sample_many(
+        self, batch_size: int, n_batches: int, sample_next_obs: bool = False, clone: bool = False, **kwargs
+    ) -> Dict[str, np.ndarray]:
+        """Draw multiple mini-batches with a single call, sharing the valid-index
+        construction, the random-index generation and the per-key gather across all
+        of them. Replaces a Python loop of 'n_batches' separate 'sample' calls:
+        iterate the leading dimension of the returned arrays instead.
+
+        Args:
+            batch_size (int): Number of elements of each mini-batch.
+            n_batches (int): the number of mini-batches to draw.
+            sample_next_obs (bool): whether to sample the next observations from the 'self.obs_keys' keys.
+                Defaults to False.
+            clone (bool): whether to clone the sampled numpy arrays. Defaults to False.
+            kwargs: additional keyword arguments to be passed to the 'self.sample' method.
+
+        Returns:
+            Dict[str, np.ndarray]: the sampled dictionary with a shape of [n_batches, batch_size, ...].
+        """
+        return self.sample(
+            batch_size=batch_size, sample_next_obs=sample_next_obs, clone=clone, n_samples=n_batches, **kwargs
+        )
+
     def _get_samples(
         self, batch_idxes: np.ndarray, sample_next_obs: bool = False, clone: bool = False
     ) -> Dict[str, np.ndarray]:
         if self.empty:
             raise RuntimeError("The buffer has not been initialized. Try to add some data first.")
         samples: Dict[str, np.ndarray] = {}
-        env_idxes = self._rng.integers(0, self.n_envs, size=(len(batch_idxes),), dtype=np.intp)
-        flattened_idxes = (batch_idxes * self.n_envs + env_idxes).flat
-        if sample_next_obs:
-            flattened_next_idxes = (((batch_idxes + 1) % self._buffer_size) * self.n_envs + env_idxes).flat
+        if self._n_envs == 1:
+            # with a single environment the flat index is the batch index itself
+            flattened_idxes = batch_idxes
+            if sample_next_obs:
+                flattened_next_idxes = self._increment(batch_idxes)
+        else:
+            env_idxes = self._rand_idxes(len(batch_idxes), self.n_envs)
+            flattened_idxes = batch_idxes * self.n_envs + env_idxes
+            if sample_next_obs:
+                flattened_next_idxes = self._increment(batch_idxes) * self.n_envs + env_idxes
+        reuse = self._reuse_sample_storage and not clone
         for k, v in self.buffer.items():
-            samples[k] = np.take(np.reshape(v, (-1, *v.shape[2:])), flattened_idxes, axis=0)
-            if clone:
-                samples[k] = samples[k].copy()
+            flat_v = np.reshape(v, (-1, *v.shape[2:]))
+            out_shape = (len(batch_idxes), *flat_v.shape[1:])
+            out = self._out_pool.get(k, out_shape, flat_v.dtype) if reuse else None
+            samples[k] = np.take(flat_v, flattened_idxes, axis=0, out=out)
             if k in self._obs_keys and sample_next_obs:
-                samples[f"next_{k}"] = np.take(np.reshape(v, (-1, *v.shape[2:])), flattened_next_idxes, axis=0)
-                if clone:
-                    samples[f"next_{k}"] = samples[f"next_{k}"].copy()
+                next_out = self._out_pool.get(f"next_{k}", out_shape, flat_v.dtype) if reuse else None
+                samples[f"next_{k}"] = np.take(flat_v, flattened_next_idxes, axis=0, out=next_out)
         return samples
 
     @torch.no_grad()
@@ -296,6 +502,7 @@ class ReplayBuffer:
         dtype: Optional[torch.dtype] = None,
         device: str | torch.dtype = "cpu",
         from_numpy: bool = False,
+        pin_memory: bool = False,
         **kwargs,
     ) -> Dict[str, Tensor]:
         """Sample elements from the replay buffer and convert them to torch tensors.
@@ -311,6 +518,9 @@ class ReplayBuffer:
             from_numpy (bool, optional): whether to convert the numpy arrays to torch tensors
                 with the 'torch.from_numpy' function. If False, then the numpy arrays are converted
                 with the 'torch.as_tensor' function. Defaults to False.
+            pin_memory (bool, optional): whether to stage host-to-device copies through
+                page-locked memory, enabling asynchronous transfers. Only relevant when
+                moving the tensors to a CUDA device. Defaults to False.
             kwargs: additional keyword arguments to be passed to the 'self.sample' method.
 
         Returns:
@@ -322,7 +532,8 @@ class ReplayBuffer:
             batch_size=batch_size, sample_next_obs=sample_next_obs, clone=clone, n_samples=n_samples, **kwargs
         )
         return {
-            k: get_tensor(v, dtype=dtype, clone=clone, device=device, from_numpy=from_numpy) for k, v in samples.items()
+            k: get_tensor(v, dtype=dtype, clone=clone, device=device, from_numpy=from_numpy, pin_memory=pin_memory)
+            for k, v in samples.items()
         }
 
     def __getitem__(self, key: str) -> np.ndarray | np.memmap | MemmapArray:
@@ -391,6 +602,13 @@ class SequentialReplayBuffer(ReplayBuffer):
             kwargs: additional keyword arguments.
         """
         super().__init__(buffer_size, n_envs, obs_keys, memmap, memmap_dir, memmap_mode, **kwargs)
+        # 'sequence_length' is constant across a training run, so the relative
+        # sequence offsets can be built once and reused on every 'sample'
+        self._chunk_length_cache: Dict[int, np.ndarray] = {}
+
+    def __setstate__(self, state: Dict[str, typing.Any]) -> None:
+        super().__setstate__(state)
+        self.__dict__.setdefault("_chunk_length_cache", {})
 
     def sample(
         self,
@@ -408,7 +626,10 @@ class SequentialReplayBuffer(ReplayBuffer):
             batch_size (int): Number of element to sample
             sample_next_obs (bool): whether to sample the next observations from the 'observations' key.
                 Defaults to False.
-            clone (bool): whether to clone the sampled tensors.
+            clone (bool): whether to return batches that own their storage. Only relevant
+                when the buffer was created with 'reuse_sample_storage=True', in which case
+                batches sampled with 'clone=False' are views over per-buffer scratch storage
+                that is overwritten by the next 'sample' call.
             n_samples (int): the number of samples to perform. Defaults to 1.
             sequence_length (int): the length of the sequence of each element. Defaults to 1.
 
@@ -445,19 +666,23 @@ class SequentialReplayBuffer(ReplayBuffer):
             # end of the second range, if the first range is empty, then the second range ends
             # in (buffer_size + (self._pos - sequence_length + 1)), otherwise the sequence will contain
             # invalid values
-            second_range_end = self.buffer_size if first_range_end >= 0 else self.buffer_size + first_range_end
-            valid_idxes = np.array(
-                list(range(0, first_range_end)) + list(range(self._pos, second_range_end)), dtype=np.intp
-            )
+            cache_key = (self._pos, sequence_length)
+            if self._valid_idxes_key != cache_key:
+                self._valid_idxes_cache = _valid_indices(self._pos, self.buffer_size, first_range_end)
+                self._valid_idxes_key = cache_key
+            valid_idxes = self._valid_idxes_cache
             # start_idxes are the indices of the first elements of the sequences
-            start_idxes = valid_idxes[self._rng.integers(0, len(valid_idxes), size=(batch_dim,), dtype=np.intp)]
+            start_idxes = valid_idxes[self._rand_idxes(batch_dim, len(valid_idxes))]
         else:
             # when the buffer is not full, we need to start the sequence so that it does not go out of bounds
-            start_idxes = self._rng.integers(0, self._pos - sequence_length + 1, size=(batch_dim,), dtype=np.intp)
+            start_idxes = self._rand_idxes(batch_dim, self._pos - sequence_length + 1)
 
         # chunk_length contains the relative indices of the sequence (0, 1, ..., sequence_length-1)
-        chunk_length = np.arange(sequence_length, dtype=np.intp).reshape(1, -1)
-        idxes = (start_idxes.reshape(-1, 1) + chunk_length) % self.buffer_size
+        chunk_length = self._chunk_length_cache.get(sequence_length)
+        if chunk_length is None:
+            chunk_length = np.arange(sequence_length, dtype=np.intp).reshape(1, -1)
+            self._chunk_length_cache[sequence_length] = chunk_length
+        idxes = self._wrap(start_idxes.reshape(-1, 1) + chunk_length)
 
         # (n_samples, sequence_length, batch_size)
         return self._get_samples(
@@ -474,27 +699,33 @@ class SequentialReplayBuffer(ReplayBuffer):
         clone: bool = False,
     ) -> Dict[str, np.ndarray]:
         batch_shape = (batch_size * n_samples, sequence_length)  # [Batch_size * N_samples, Seq_len]
-        flattened_batch_idxes = np.ravel(batch_idxes)
 
         # Each sequence must come from the same environment
         if self._n_envs == 1:
-            env_idxes = np.zeros((np.prod(batch_shape),), dtype=np.intp)
+            # with a single environment the flat index is the batch index itself
+            flattened_batch_idxes = np.ravel(batch_idxes)
+            flattened_idxes = flattened_batch_idxes
+            if sample_next_obs:
+                flattened_next_idxes = self._increment(flattened_batch_idxes)
         else:
-            env_idxes = self._rng.integers(0, self.n_envs, size=(batch_shape[0],), dtype=np.intp)
-            env_idxes = np.reshape(env_idxes, (-1, 1))
-            env_idxes = np.tile(env_idxes, (1, sequence_length))
-            env_idxes = np.ravel(env_idxes)
-
-        # Flatten indexes
-        flattened_idxes = (flattened_batch_idxes * self._n_envs + env_idxes).flat
+            # one environment per sequence, broadcast over the time steps
+            # while computing the flat indices instead of tiling the env indices
+            env_idxes = self._rand_idxes(batch_shape[0], self.n_envs)[:, None]
+            flattened_idxes = np.ravel(batch_idxes * self._n_envs + env_idxes)
+            if sample_next_obs:
+                flattened_next_idxes = np.ravel(self._increment(batch_idxes) * self._n_envs + env_idxes)
 
         # Get samples
         samples: Dict[str, np.ndarray] = {}
+        reuse = self._reuse_sample_storage and not clone
         for k, v in self.buffer.items():
             # Retrieve the items by flattening the indices
             # (b1_s1, b1_s2, b1_s3, ..., bn_s1, bn_s2, bn_s3, ...)
             # where bm_sk is the k-th elements in the sequence of the m-th batch
-            flattened_v = np.take(np.reshape(v, (-1, *v.shape[2:])), flattened_idxes, axis=0)
+            flat_v = np.reshape(v, (-1, *v.shape[2:]))
+            out_shape = (len(flattened_idxes), *flat_v.shape[1:])
+            out = self._out_pool.get(k, out_shape, flat_v.dtype) if reuse else None
+            flattened_v = np.take(flat_v, flattened_idxes, axis=0, out=out)
             # Properly reshape the items:
             # [
             #   [b1_s1, b1_s2, ...],
@@ -512,7 +743,8 @@ class SequentialReplayBuffer(ReplayBuffer):
             if clone:
                 samples[k] = samples[k].copy()
             if sample_next_obs:
-                flattened_next_v = v[(flattened_batch_idxes + 1) % self._buffer_size, env_idxes]
+                next_out = self._out_pool.get(f"next_{k}", out_shape, flat_v.dtype) if reuse else None
+                flattened_next_v = np.take(flat_v, flattened_next_idxes, axis=0, out=next_out)
                 batched_next_v = np.reshape(
                     flattened_next_v, (n_samples, batch_size, sequence_length) + flattened_next_v.shape[1:]
                 )
@@ -540,6 +772,12 @@ class EnvIndependentReplayBuffer:
     ):
         """A replay buffer implementation that is composed of multiple independent replay buffers.
 
+        Every environment gets its own single-env 'buffer_cls' instance, so each
+        timeline is stored contiguously: sampling gathers consecutive steps of one
+        environment from adjacent rows (and adjacent pages for disk-backed memmap
+        storage) instead of rows interleaved with a stride of 'n_envs' as in the
+        flat [buffer_size, n_envs, ...] layout of 'ReplayBuffer'.
+
         Args:
             buffer_size (int): the buffer size.
             n_envs (int, optional): the number of environments. Defaults to 1.
@@ -708,6 +946,7 @@ class EnvIndependentReplayBuffer:
         dtype: Optional[torch.dtype] = None,
         device: str | torch.dtype = "cpu",
         from_numpy: bool = False,
+        pin_memory: bool = False,
         **kwargs,
     ) -> Dict[str, Tensor]:
         """Sample elements from the replay buffer and convert them to torch tensors.
@@ -724,6 +963,9 @@ class EnvIndependentReplayBuffer:
             from_numpy (bool, optional): whether to convert the numpy arrays to torch tensors
                 with the 'torch.from_numpy' function. If False, then the numpy arrays are converted
                 with the 'torch.as_tensor' function. Defaults to False.
+            pin_memory (bool, optional): whether to stage host-to-device copies through
+                page-locked memory, enabling asynchronous transfers. Only relevant when
+                moving the tensors to a CUDA device. Defaults to False.
             kwargs: additional keyword arguments to be passed to the 'self.sample' method.
 
         Returns:
@@ -739,7 +981,8 @@ class EnvIndependentReplayBuffer:
             **kwargs,
         )
         return {
-            k: get_tensor(v, dtype=dtype, clone=clone, device=device, from_numpy=from_numpy) for k, v in samples.items()
+            k: get_tensor(v, dtype=dtype, clone=clone, device=device, from_numpy=from_numpy, pin_memory=pin_memory)
+            for k, v in samples.items()
         }
 
 
@@ -1130,6 +1373,7 @@ class EpisodeBuffer:
         dtype: Optional[torch.dtype] = None,
         device: str | torch.dtype = "cpu",
         from_numpy: bool = False,
+        pin_memory: bool = False,
         **kwargs,
     ) -> Dict[str, Tensor]:
         """Sample elements from the replay buffer and convert them to torch tensors.
@@ -1147,11 +1391,15 @@ class EpisodeBuffer:
             from_numpy (bool, optional): whether to convert the numpy arrays to torch tensors
                 with the 'torch.from_numpy' function. If False, then the numpy arrays are converted
                 with the 'torch.as_tensor' function. Defaults to False.
+            pin_memory (bool, optional): whether to stage host-to-device copies through
+                page-locked memory, enabling asynchronous transfers. Only relevant when
+                moving the tensors to a CUDA device. Defaults to False.
             kwargs: additional keyword arguments to be passed to the 'self.sample' method.
         """
         samples = self.sample(batch_size, sample_next_obs, n_samples, clone, sequence_length)
         return {
-            k: get_tensor(v, dtype=dtype, clone=clone, device=device, from_numpy=from_numpy) for k, v in samples.items()
+            k: get_tensor(v, dtype=dtype, clone=clone, device=device, from_numpy=from_numpy, pin_memory=pin_memory)
+            for k, v in samples.items()
         }
 
 
@@ -1161,20 +1409,23 @@ def get_tensor(
     clone: bool = False,
     device: str | torch.dtype = "cpu",
     from_numpy: bool = False,
+    pin_memory: bool = False,
 ) -> Tensor:
     if isinstance(array, MemmapArray):
         array = array.array
     if clone:
         array = array.copy()
+    torch_dtype = NUMPY_TO_TORCH_DTYPE_DICT[array.dtype] if dtype is None else dtype
+    if pin_memory and torch.cuda.is_available() and torch.device(device).type == "cuda":
+        # Stage the copy through page-locked host memory so the host-to-device
+        # transfer can run asynchronously with respect to the current stream
+        if from_numpy:
+            torch_v = torch.from_numpy(array).to(dtype=torch_dtype)
+        else:
+            torch_v = torch.as_tensor(array, dtype=torch_dtype)
+        return torch_v.pin_memory().to(device=device, non_blocking=True)
     if from_numpy:
-        torch_v = torch.from_numpy(array).to(
-            dtype=NUMPY_TO_TORCH_DTYPE_DICT[array.dtype] if dtype is None else dtype,
-            device=device,
-        )
+        torch_v = torch.from_numpy(array).to(dtype=torch_dtype, device=device)
     else:
-        torch_v = torch.as_tensor(
-            array,
-            dtype=NUMPY_TO_TORCH_DTYPE_DICT[array.dtype] if dtype is None else dtype,
-            device=device,
-        )
+        torch_v = torch.as_tensor(array, dtype=torch_dtype, device=device)
     return torch_v
@@ -12,6 +12,7 @@ _IS_DMC_AVAILABLE = RequirementCache("dm_control")
 _IS_MINEDOJO_AVAILABLE = RequirementCache("minedojo")
 _IS_MINERL_0_4_4_AVAILABLE = RequirementCache("minerl==0.4.4")
 _IS_MLFLOW_AVAILABLE = RequirementCache("mlflow>=2.8", "mlflow")
+_IS_NUMBA_AVAILABLE = RequirementCache("numba")
 _IS_SUPER_MARIO_BROS_AVAILABLE = RequirementCache("gym-super-mario-bros==7.4.0")
 _IS_TORCH_GREATER_EQUAL_2_0 = RequirementCache("torch>=2.0")
 _IS_WINDOWS = platform.system() == "Windows"
@@ -71,6 +71,22 @@ def test_replay_buffer_add_tds_exceeding_buf_size_multiple_times():
     np.testing.assert_allclose(rb["a"][: rb._pos], td3["a"][rb.buffer_size - rb._pos + remainder :])
 
 
+def test_replay_buffer_add_td_exceeding_buf_size_nonzero_pos():
+    buf_size = 5
+    n_envs = 1
+    rb = ReplayBuffer(buf_size, n_envs)
+    td1 = {"a": np.random.rand(3, 1, 1)}
+    td2 = {"a": np.random.rand(9, 1, 1)}
+    rb.add(td1)
+    assert rb._pos == 3
+    rb.add(td2)
+    assert rb.full
+    assert rb._pos == 2
+    # The last 'buf_size' elements of td2 are kept, with the newest one at 'rb._pos - 1'
+    np.testing.assert_allclose(rb["a"][: rb._pos], td2["a"][-rb._pos :])
+    np.testing.assert_allclose(rb["a"][rb._pos :], td2["a"][-buf_size : -rb._pos])
+
+
 def test_replay_buffer_add_single_td_size_is_not_multiple():
     buf_size = 5
     n_envs = 1
@@ -105,6 +121,20 @@ def test_replay_buffer_add_replay_buffer():
     assert (rb1.buffer["a"] == rb2.buffer["a"]).all()
 
 
+def test_replay_buffer_add_many():
+    buf_size = 5
+    n_envs = 1
+    rb = ReplayBuffer(buf_size, n_envs)
+    td1 = {"a": np.random.rand(2, 1, 1)}
+    td2 = {"a": np.random.rand(2, 1, 1)}
+    rb.add_many([td1, td2])
+    assert rb._pos == 4
+    np.testing.assert_allclose(rb["a"][:2], td1["a"])
+    np.testing.assert_allclose(rb["a"][2:4], td2["a"])
+    with pytest.raises(ValueError, match="'chunks' must contain at least one element"):
+        rb.add_many([])
+
+
 def test_replay_buffer_add_error():
     import torch
 
@@ -152,6 +182,57 @@ def test_replay_buffer_sample():
     assert s["next_a"].shape == tuple([2, 4, 1])
 
 
+def test_replay_buffer_dtype_overrides():
+    buf_size = 5
+    n_envs = 1
+    rb = ReplayBuffer(buf_size, n_envs, dtype_overrides={"a": np.dtype(np.float16)})
+    rb.add({"a": np.random.rand(2, 1, 1), "b": np.random.rand(2, 1, 1)})
+    assert rb["a"].dtype == np.float16
+    assert rb["b"].dtype == np.float64
+    s = rb.sample(4)
+    assert s["a"].dtype == np.float16
+    assert s["b"].dtype == np.float64
+
+
+def test_replay_buffer_sample_many():
+    buf_size = 5
+    n_envs = 1
+    rb = ReplayBuffer(buf_size, n_envs, obs_keys=("a",))
+    td1 = {"a": np.random.rand(6, 1, 1)}
+    rb.add(td1)
+    s = rb.sample_many(4, 3)
+    assert s["a"].shape == tuple([3, 4, 1])
+    s = rb.sample_many(4, 2, sample_next_obs=True)
+    assert s["a"].shape == tuple([2, 4, 1])
+    assert s["next_a"].shape == tuple([2, 4, 1])
+
+
+def test_replay_buffer_sample_storage_ownership():
+    buf_size = 5
+    n_envs = 1
+    rb = ReplayBuffer(buf_size, n_envs)
+    rb.add({"a": np.random.rand(6, 1, 1)})
+    s1 = rb.sample(4)
+    first = s1["a"].copy()
+    s2 = rb.sample(4)
+    # by default every batch owns its storage and survives later samples
+    assert not np.shares_memory(s1["a"], s2["a"])
+    np.testing.assert_allclose(s1["a"], first)
+
+
+def test_replay_buffer_sample_storage_reuse():
+    buf_size = 5
+    n_envs = 1
+    rb = ReplayBuffer(buf_size, n_envs, reuse_sample_storage=True)
+    rb.add({"a": np.random.rand(6, 1, 1)})
+    s1 = rb.sample(4)
+    s2 = rb.sample(4)
+    # with reuse enabled, consecutive batches share the pooled scratch storage
+    assert np.shares_memory(s1["a"], s2["a"])
+    s3 = rb.sample(4, clone=True)
+    assert not np.shares_memory(s2["a"], s3["a"])
+
+
 def test_replay_buffer_sample_one_sample_next_obs_error():
     buf_size = 5
     n_envs = 1
@@ -275,6 +356,50 @@ def test_memmap_to_file_replay_buffer():
     shutil.rmtree(root_dir)
 
 
+def test_replay_buffer_restore_old_checkpoint():
+    buf_size = 5
+    n_envs = 1
+    rb = ReplayBuffer(buf_size, n_envs)
+    rb.add({"observations": np.random.rand(3, 1, 1)})
+    # simulate a checkpoint written before the sampling caches existed
+    state = rb.__dict__.copy()
+    for attr in (
+        "_is_pow2",
+        "_mask",
+        "_rng_pool",
+        "_rng_cursor",
+        "_valid_idxes_cache",
+        "_valid_idxes_key",
+        "_out_pool",
+        "_reuse_sample_storage",
+        "_dtype_overrides",
+    ):
+        del state[attr]
+    restored = ReplayBuffer.__new__(ReplayBuffer)
+    restored.__setstate__(state)
+    restored.add({"observations": np.random.rand(2, 1, 1)})
+    sample = restored.sample(4, sample_next_obs=True)
+    assert sample["observations"].shape == (1, 4, 1)
+
+
+def test_replay_buffer_checkpoint_drops_caches():
+    import pickle
+
+    buf_size = 8
+    n_envs = 1
+    rb = ReplayBuffer(buf_size, n_envs, reuse_sample_storage=True)
+    rb.add({"observations": np.random.rand(10, 1, 1)})
+    rb.sample(4, sample_next_obs=True)
+    assert rb._rng_pool is not None
+    restored = pickle.loads(pickle.dumps(rb))
+    # the sampling caches are dropped from the pickled state and rebuild on first use
+    assert restored._rng_pool is None
+    assert restored._valid_idxes_cache is None
+    assert restored._out_pool._arrays == {}
+    sample = restored.sample(4, sample_next_obs=True)
+    assert sample["observations"].shape == (1, 4, 1)
+
+
 def test_obs_keys_replay_buffer():
     buf_size = 10
     n_envs = 4
@@ -54,6 +54,46 @@ def test_seq_replay_buffer_sample():
     assert s["a"].shape == tuple([1, 2, 4, 1])
 
 
+def test_seq_replay_buffer_sample_storage_ownership():
+    buf_size = 10
+    n_envs = 1
+    rb = SequentialReplayBuffer(buf_size, n_envs)
+    rb.add({"a": np.random.rand(11, 1, 1)})
+    s1 = rb.sample(4, sequence_length=2)
+    first = s1["a"].copy()
+    s2 = rb.sample(4, sequence_length=2)
+    # by default every batch owns its storage and survives later samples
+    assert not np.shares_memory(s1["a"], s2["a"])
+    np.testing.assert_allclose(s1["a"], first)
+
+
+def test_seq_replay_buffer_sample_storage_reuse():
+    buf_size = 10
+    n_envs = 1
+    rb = SequentialReplayBuffer(buf_size, n_envs, reuse_sample_storage=True)
+    rb.add({"a": np.random.rand(11, 1, 1)})
+    s1 = rb.sample(4, sequence_length=2)
+    s2 = rb.sample(4, sequence_length=2)
+    # with reuse enabled, consecutive batches share the pooled scratch storage
+    assert np.shares_memory(s1["a"], s2["a"])
+    s3 = rb.sample(4, sequence_length=2, clone=True)
+    assert not np.shares_memory(s2["a"], s3["a"])
+
+
+def test_seq_replay_buffer_restore_old_checkpoint():
+    buf_size = 10
+    n_envs = 1
+    rb = SequentialReplayBuffer(buf_size, n_envs)
+    rb.add({"a": np.random.rand(8, 1, 1)})
+    # simulate a checkpoint written before the sequence-offset cache existed
+    state = rb.__dict__.copy()
+    del state["_chunk_length_cache"]
+    restored = SequentialReplayBuffer.__new__(SequentialReplayBuffer)
+    restored.__setstate__(state)
+    s = restored.sample(4, sequence_length=2)
+    assert s["a"].shape == tuple([1, 2, 4, 1])
+
+
 def test_seq_replay_buffer_sample_one_element():
     buf_size = 1
     n_envs = 1